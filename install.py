@@ -5,38 +5,70 @@ Refer to: implementation_plan.md for the 6-Phase Tofu-Centric Flow.
 """
 
 import argparse
+import base64
+import functools
+import hmac
+import importlib.util
+import io
 import json
 import os
+import random
+import re
+import select
+import shlex
+import shutil
 import subprocess
 import sys
+import tarfile
+import textwrap
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from uuid import uuid4
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Clusterra Connect Installer")
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--profile")
+    parser.add_argument("--region")
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="ignore cached VPC/subnet/key-pair listings from previous runs",
+    )
+    return parser.parse_args()
+
+
+# Parse before the third-party imports below so --help and usage errors return
+# without paying for boto3/rich.
+ARGS = parse_args() if __name__ == "__main__" else None
 
 # Dependency Check
 try:
     import boto3
-    from botocore.exceptions import ClientError, ProfileNotFound
+    from boto3.exceptions import S3UploadFailedError
+    from botocore.auth import SigV4Auth
+    from botocore.awsrequest import AWSRequest
+    from botocore.config import Config
+    from botocore.exceptions import ClientError, ProfileNotFound, WaiterError
 except ImportError:
     print("❌ boto3 is required. Install with: pip install boto3")
     sys.exit(1)
 
-try:
-    import questionary
-    from questionary import Style
-except ImportError:
-    print("❌ questionary is required. Install with: pip install questionary")
-    sys.exit(1)
-
-try:
-    import requests
-except ImportError:
-    print("❌ requests is required. Install with: pip install requests")
-    sys.exit(1)
+# questionary (prompt_toolkit) and requests are only needed by gather_inputs and
+# phase_4_register: confirm they're installed now, import them where used.
+for _module in ("questionary", "requests"):
+    if importlib.util.find_spec(_module) is None:
+        print(f"❌ {_module} is required. Install with: pip install {_module}")
+        sys.exit(1)
 
 try:
     from rich.console import Console
     from rich.panel import Panel
     from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+    from rich.text import Text
 except ImportError:
     print("❌ rich is required. Install with: pip install rich")
     sys.exit(1)
@@ -52,6 +84,12 @@ CLUSTERRA_SERVICE_ACCOUNT_ID = (
     "493245399820"  # Prod account that owns the service network
 )
 
+GENERATED_DIR = Path("generated")
+TFVARS_PATH = GENERATED_DIR / "terraform.tfvars"
+AWS_CACHE_DIR = GENERATED_DIR / ".aws_cache"
+AWS_CACHE_TTL = 300  # seconds before a cached VPC/subnet/key listing is refreshed
+TOOL_CACHE_PATH = GENERATED_DIR / ".tool_versions.json"
+
 # Override for Dev Environment
 # Check CLUSTERRA_ENV first, then fall back to AWS_PROFILE (though AWS_PROFILE is unreliable if chaining)
 is_dev = (
@@ -65,57 +103,151 @@ if is_dev:
 
 console = Console()
 
-PROMPT_STYLE = Style(
-    [
-        ("qmark", "fg:cyan bold"),
-        ("question", "bold"),
-        ("answer", "fg:green"),
-        ("pointer", "fg:cyan bold"),
-        ("highlighted", "fg:cyan"),
-        ("selected", "fg:green"),
-    ]
+# Shared by every client: adaptive retries absorb throttling in the polling
+# loops, keep-alive + a larger pool let concurrent calls reuse connections.
+BOTO_CONFIG = Config(
+    retries={"mode": "adaptive", "max_attempts": 10},
+    tcp_keepalive=True,
+    max_pool_connections=20,
+    connect_timeout=5,
+    read_timeout=20,
 )
 
+# `key = "value"` / `key = value` assignments in terraform.tfvars (no hcl dependency)
+TFVAR_RE = re.compile(r'^[ \t]*(\w+)[ \t]*=[ \t]*"?([^"\n]*)"?', re.MULTILINE)
+
+# generated/terraform.tfvars layout written by gather_inputs; ssh_key_name and
+# head_node_instance_id are appended only when set. deploy_new_cluster is an
+# HCL bool, the rest are strings.
+TFVARS_TEMPLATE = textwrap.dedent("""\
+    region = "{region}"
+    cluster_name = "{cluster_name}"
+    vpc_id = "{vpc_id}"
+    subnet_id = "{subnet_id}"
+    secondary_subnet_id = "{secondary_subnet_id}"
+    tenant_id = "{tenant_id}"
+    cluster_id = "{cluster_id}"
+    clusterra_api_endpoint = "{clusterra_api_endpoint}"
+    clusterra_service_network_id = "{clusterra_service_network_id}"
+    clusterra_account_id = "{clusterra_account_id}"
+    deploy_new_cluster = {deploy_new_cluster}
+""")
+
+# "clus" + 4 hex chars, as generated from uuid4().hex in gather_inputs
+CLUSTER_ID_RE = re.compile(r"clus[0-9a-f]{4}")
+
+PROMPT_STYLE_RULES = [
+    ("qmark", "fg:cyan bold"),
+    ("question", "bold"),
+    ("answer", "fg:green"),
+    ("pointer", "fg:cyan bold"),
+    ("highlighted", "fg:cyan"),
+    ("selected", "fg:green"),
+]
+
 # ─────────────────────────────────────────────────────────────────────────────
 # HELPER FUNCTIONS (Preserved)
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Pre-flight probes run concurrently; guards the PATH fallback mutation and
+# the tool version cache below.
+_PATH_LOCK = threading.Lock()
+_TOOL_CACHE_LOCK = threading.Lock()
 
-def check_tool_installed(tool: str, install_hint: str) -> tuple[bool, str | None]:
-    """Check if a CLI tool is installed and return version."""
-    try:
-        cmd = [tool, "--version"] if tool in ["aws", "node"] else [tool, "version"]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-
-        if result.returncode == 0:
-            output = result.stdout.strip() or result.stderr.strip()
-            if output.startswith("{"):
-                try:
-                    data = json.loads(output)
-                    return True, data.get("version", "unknown")
-                except json.JSONDecodeError:
-                    pass
-            return True, output.split("\n")[0]
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        pass
-
-    # Common fallback paths
-    common_paths = [
+# Common install locations that may be missing from PATH, trimmed to those
+# that exist on this machine
+CANDIDATE_BIN_DIRS = tuple(
+    p
+    for p in (
         Path.home() / ".local/bin",
         Path("/opt/homebrew/bin"),
         Path("/usr/local/bin"),
         Path.home() / "Library/Python/3.10/bin",  # Common mac pcluster location
         Path.home() / "Library/Python/3.11/bin",
-    ]
+    )
+    if p.is_dir()
+)
+
 
-    for search_path in common_paths:
-        tool_path = search_path / tool
-        if tool_path.exists() and os.access(tool_path, os.X_OK):
-            current_path = os.environ.get("PATH", "")
-            if str(search_path) not in current_path.split(os.pathsep):
-                os.environ["PATH"] = f"{search_path}{os.pathsep}{current_path}"
-            return True, f"Found in {search_path}"
+def probe_tool_version(tool: str, resolved: str) -> str | None:
+    """Run the tool's version command; None if it fails."""
+    try:
+        cmd = [resolved, "--version" if tool in {"aws", "node"} else "version"]
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
 
+    output = result.stdout.strip() or result.stderr.strip()
+    if output.startswith("{"):
+        try:
+            return json.loads(output).get("version", "unknown")
+        except json.JSONDecodeError:
+            pass
+    return output.split("\n")[0]
+
+
+def cached_tool_version(tool: str, resolved: str) -> str | None:
+    """probe_tool_version, reusing the last run's answer while the binary
+    behind `resolved` is unchanged (same real path, inode, mtime and size).
+
+    Symlinks (e.g. Homebrew) are followed, so an upgrade is noticed. Script
+    shims (pyenv, asdf, mise) don't change when the tool behind them does;
+    forget_tool_version drops the entry when a later invocation fails.
+    """
+    real = os.path.realpath(resolved)
+    try:
+        st = os.stat(real)
+    except OSError:
+        return None
+    stat_key = [st.st_ino, st.st_mtime_ns, st.st_size]
+    with _TOOL_CACHE_LOCK:
+        entry = _read_json_cache(TOOL_CACHE_PATH).get(tool)
+    if entry and entry.get("path") == real and entry.get("stat") == stat_key:
+        return entry["version"]
+
+    version = probe_tool_version(tool, resolved)
+    if version is not None:
+        with _TOOL_CACHE_LOCK:
+            entries = _read_json_cache(TOOL_CACHE_PATH)
+            entries[tool] = {"path": real, "stat": stat_key, "version": version}
+            GENERATED_DIR.mkdir(parents=True, exist_ok=True)
+            write_text_atomic(TOOL_CACHE_PATH, json.dumps(entries))
+    return version
+
+
+def forget_tool_version(tool: str):
+    """Drop a tool's cached version so the next pre-flight probes it again."""
+    with _TOOL_CACHE_LOCK:
+        entries = _read_json_cache(TOOL_CACHE_PATH)
+        if entries.pop(tool, None) is not None:
+            write_text_atomic(TOOL_CACHE_PATH, json.dumps(entries))
+
+
+def check_tool_installed(tool: str, install_hint: str) -> tuple[bool, str | None]:
+    """Check if a CLI tool is installed and return version."""
+    # One lookup over PATH plus the common install locations
+    search_path = os.pathsep.join(
+        [os.environ.get("PATH", ""), *map(str, CANDIDATE_BIN_DIRS)]
+    )
+    resolved = shutil.which(tool, path=search_path)
+    if not resolved:
+        return False, install_hint
+
+    bin_dir = os.path.dirname(resolved)
+    with _PATH_LOCK:
+        current_path = os.environ.get("PATH", "")
+        if bin_dir not in current_path.split(os.pathsep):
+            os.environ["PATH"] = f"{bin_dir}{os.pathsep}{current_path}"
+
+    version = cached_tool_version(tool, resolved)
+    if version is not None:
+        return True, version
+    # Binaries in the fallback locations count as installed even if the
+    # version probe fails; a broken one on PATH does not
+    if Path(bin_dir) in CANDIDATE_BIN_DIRS:
+        return True, f"Found in {bin_dir}"
     return False, install_hint
 
 
@@ -128,23 +260,31 @@ def run_preflight_checks() -> bool:
         # ("pcluster", "pip install aws-parallelcluster"),
     ]
 
+    # Probes are independent subprocess spawns, so run them concurrently and
+    # report in the declared order.
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        results = list(executor.map(lambda check: check_tool_installed(*check), checks))
+
+    # Render the whole report in one print
     all_passed = True
-    console.print("[bold]Pre-flight Checks[/bold]")
-    for tool, hint in checks:
-        installed, info = check_tool_installed(tool, hint)
+    report = ["[bold]Pre-flight Checks[/bold]"]
+    for (tool, hint), (installed, info) in zip(checks, results):
         if installed:
-            console.print(f"  [green]✓[/green] {tool}: [dim]{info}[/dim]")
+            report.append(f"  [green]✓[/green] {tool}: [dim]{info}[/dim]")
         else:
-            console.print(f"  [red]✗[/red] {tool}: [red]not found[/red]")
-            console.print(f"    [dim]Install: {hint}[/dim]")
+            report.append(f"  [red]✗[/red] {tool}: [red]not found[/red]")
+            report.append(f"    [dim]Install: {hint}[/dim]")
             all_passed = False
-    console.print()
+    console.print("\n".join(report) + "\n")
     return all_passed
 
 
+@functools.lru_cache(maxsize=4)
 def get_aws_session(
     profile: str | None = None, region: str | None = None
 ) -> boto3.Session:
+    """Build a session once per (profile, region), so its credentials and the
+    per-session client/describe caches carry over when a region is revisited."""
     try:
         return boto3.Session(profile_name=profile, region_name=region)
     except ProfileNotFound:
@@ -152,49 +292,119 @@ def get_aws_session(
         sys.exit(1)
 
 
+def session_for_region(session: boto3.Session, region: str) -> boto3.Session:
+    """Same credential source as `session`, pointed at `region`."""
+    # profile_name reports "default" even when no profile was configured, and
+    # naming a missing "default" profile explicitly raises ProfileNotFound
+    profile = session.profile_name
+    if profile not in session.available_profiles:
+        profile = None
+    return get_aws_session(profile, region)
+
+
+# boto3 Sessions aren't thread-safe, and lru_cache doesn't serialize misses:
+# the gather_inputs prefetch, background cache refreshes and phase 2b's secret
+# fetch can all build their first client at once. Cache hits skip the lock.
+_CLIENT_LOCK = threading.Lock()
+
+
+@functools.cache
+def get_client(session: boto3.Session, service: str):
+    """Return a boto3 client for a service, built once per session."""
+    with _CLIENT_LOCK:
+        return session.client(service, config=BOTO_CONFIG)
+
+
+# Prefetch threads and background refreshes share one cache file per region.
+_AWS_CACHE_LOCK = threading.Lock()
+
+
+def _read_json_cache(path: Path) -> dict:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def disk_cached(func):
+    """Cache an inventory lookup in AWS_CACHE_DIR/<region>.json between runs.
+
+    Entries younger than AWS_CACHE_TTL are returned as-is; older ones are
+    returned immediately and refreshed in a background thread. Empty results
+    (including the [] the listers return on error) are never cached.
+    """
+
+    @functools.wraps(func)
+    def wrapper(session: boto3.Session, *args):
+        path = AWS_CACHE_DIR / f"{session.region_name}.json"
+        key = ":".join((session.profile_name, func.__name__, *args))
+
+        def refresh():
+            value = func(session, *args)
+            if value:
+                with _AWS_CACHE_LOCK:
+                    entries = _read_json_cache(path)
+                    entries[key] = {"t": time.time(), "v": value}
+                    AWS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                    write_text_atomic(path, json.dumps(entries))
+            return value
+
+        with _AWS_CACHE_LOCK:
+            entry = _read_json_cache(path).get(key)
+        if entry is None:
+            return refresh()
+        if time.time() - entry["t"] > AWS_CACHE_TTL:
+            threading.Thread(target=refresh, daemon=True).start()
+        return entry["v"]
+
+    return wrapper
+
+
+# JMESPath for a resource's Name tag (null when untagged)
+NAME_TAG_EXPR = "Tags[?Key=='Name'].Value | [0]"
+
+
+@disk_cached
 def list_vpcs(session: boto3.Session) -> list[dict]:
-    ec2 = session.client("ec2")
+    ec2 = get_client(session, "ec2")
     try:
-        response = ec2.describe_vpcs()
-        return [
-            {
-                "id": v["VpcId"],
-                "name": next(
-                    (t["Value"] for t in v.get("Tags", []) if t["Key"] == "Name"),
-                    "unnamed",
-                ),
-                "cidr": v["CidrBlock"],
-            }
-            for v in response["Vpcs"]
-        ]
+        # Project just the fields we keep (Name tag included) as pages arrive
+        vpcs = (
+            ec2.get_paginator("describe_vpcs")
+            .paginate(PaginationConfig={"PageSize": 100})
+            .search(f"Vpcs[].{{id: VpcId, cidr: CidrBlock, name: {NAME_TAG_EXPR}}}")
+        )
+        return [{**v, "name": v["name"] or "unnamed"} for v in vpcs]
     except ClientError:
         return []
 
 
+@disk_cached
 def list_subnets(session: boto3.Session, vpc_id: str) -> list[dict]:
-    ec2 = session.client("ec2")
+    ec2 = get_client(session, "ec2")
     try:
-        response = ec2.describe_subnets(
-            Filters=[{"Name": "vpc-id", "Values": [vpc_id]}]
+        subnets = (
+            ec2.get_paginator("describe_subnets")
+            .paginate(
+                Filters=[{"Name": "vpc-id", "Values": [vpc_id]}],
+                PaginationConfig={"PageSize": 100},
+            )
+            .search(
+                "Subnets[].{id: SubnetId, az: AvailabilityZone, "
+                f"public: MapPublicIpOnLaunch, name: {NAME_TAG_EXPR}}}"
+            )
         )
         return [
-            {
-                "id": s["SubnetId"],
-                "name": next(
-                    (t["Value"] for t in s.get("Tags", []) if t["Key"] == "Name"),
-                    "unnamed",
-                ),
-                "az": s["AvailabilityZone"],
-                "public": s.get("MapPublicIpOnLaunch", False),
-            }
-            for s in response["Subnets"]
+            {**s, "name": s["name"] or "unnamed", "public": bool(s["public"])}
+            for s in subnets
         ]
     except ClientError:
         return []
 
 
+@disk_cached
 def list_ssh_keys(session: boto3.Session) -> list[str]:
-    ec2 = session.client("ec2")
+    ec2 = get_client(session, "ec2")
     try:
         return [kp["KeyName"] for kp in ec2.describe_key_pairs()["KeyPairs"]]
     except ClientError:
@@ -208,7 +418,9 @@ def list_ssh_keys(session: boto3.Session) -> list[str]:
 
 def run_tofu(args: list[str], description: str) -> bool:
     """Run tofu command with UI feedback."""
-    cmd = ["tofu"] + args
+    # Output is relayed line by line below, so an interactive prompt (which
+    # has no trailing newline) would never be shown; fail instead of hanging
+    cmd = ["tofu", args[0], "-input=false", *args[1:]]
     console.print(f"[cyan]→ {' '.join(cmd)}[/cyan]")
 
     # Simple spinner for UI niceness
@@ -218,38 +430,114 @@ def run_tofu(args: list[str], description: str) -> bool:
         console=console,
     ) as progress:
         task = progress.add_task(description, total=None)
-        result = subprocess.run(
-            cmd, cwd=Path.cwd()
-        )  # Allow output to stream to console
-        if result.returncode == 0:
+        # Route tofu's output through the console (instead of letting it
+        # write to the TTY directly) so it doesn't fight the spinner.
+        proc = subprocess.Popen(
+            cmd, cwd=Path.cwd(), stdout=subprocess.PIPE, stderr=subprocess.STDOUT
+        )
+        try:
+            fd = proc.stdout.fileno()
+            pending = b""
+            while True:
+                ready, _, _ = select.select([fd], [], [], 0.2)
+                if ready:
+                    chunk = os.read(fd, 4096)
+                    if not chunk:
+                        break
+                    *lines, pending = (pending + chunk).split(b"\n")
+                    for line in lines:
+                        progress.console.print(
+                            Text.from_ansi(line.decode(errors="replace"))
+                        )
+                progress.refresh()
+            if pending:
+                progress.console.print(Text.from_ansi(pending.decode(errors="replace")))
+            returncode = proc.wait()
+        except BaseException:
+            # e.g. Ctrl-C: stop tofu so it releases the state lock before
+            # main's cleanup runs its own tofu destroy
+            proc.terminate()
+            try:
+                proc.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+            raise
+        finally:
+            proc.stdout.close()
+            # apply/destroy change outputs; drop anything cached from before
+            get_tofu_outputs.cache_clear()
+
+        if returncode == 0:
             progress.update(
                 task, description=f"[green]✓ {description} complete[/green]"
             )
             return True
         else:
+            forget_tool_version("tofu")
             progress.update(task, description=f"[red]❌ {description} failed[/red]")
             return False
 
 
-def get_tofu_output(name: str, as_json: bool = False) -> str | dict | None:
+def tofu_init_if_needed(capture_output: bool = False) -> bool:
+    """Run `tofu init` unless the working directory is already initialized.
+
+    Initialized means the last init succeeded (.terraform/.init_ok) after the
+    lockfile and every .tf file in the root and modules/ last changed (e.g.
+    after a git pull or a new module block).
+    """
+    workdir = Path.cwd()
+    marker = workdir / ".terraform" / ".init_ok"
+    lockfile = workdir / ".terraform.lock.hcl"
+    if marker.exists() and lockfile.exists():
+        init_mtime = marker.stat().st_mtime_ns
+        inputs = [lockfile, *workdir.glob("*.tf"), *workdir.glob("modules/**/*.tf")]
+        if all(p.stat().st_mtime_ns < init_mtime for p in inputs):
+            console.print("[dim]tofu already initialized, skipping init[/dim]")
+            return True
+
+    console.print("[cyan]→ tofu init[/cyan]")
+    result = subprocess.run(
+        ["tofu", "init"], cwd=workdir, capture_output=capture_output, text=True
+    )
+    if result.returncode != 0:
+        forget_tool_version("tofu")
+        if capture_output:
+            error = (result.stderr or result.stdout).strip()
+            console.print("[red]❌ tofu init failed:[/red]")
+            console.print(Text.from_ansi(error))
+        return False
+    # Written last, so it is newer than anything init touched
+    marker.touch()
+    return True
+
+
+@functools.lru_cache(maxsize=1)
+def get_tofu_outputs() -> dict:
+    """Fetch all tofu outputs in one call (cached until the next run_tofu)."""
     try:
-        args = (
-            ["tofu", "output", "-json", name]
-            if as_json
-            else ["tofu", "output", "-raw", name]
+        result = subprocess.run(
+            ["tofu", "output", "-json"], capture_output=True, text=True
         )
-        result = subprocess.run(args, capture_output=True, text=True)
         if result.returncode == 0:
-            out = result.stdout.strip()
-            return json.loads(out) if as_json else out
-    except Exception:
-        pass
-    return None
+            outputs = json.loads(result.stdout or "{}")
+            return {name: out.get("value") for name, out in outputs.items()}
+    except (OSError, subprocess.SubprocessError, json.JSONDecodeError) as e:
+        console.print(f"[yellow]⚠ Could not read tofu outputs: {e}[/yellow]")
+    return {}
+
+
+def get_tofu_output(name: str, as_json: bool = False) -> str | dict | None:
+    value = get_tofu_outputs().get(name)
+    if value is None or as_json or isinstance(value, str):
+        return value
+    # Match `tofu output -raw` for numbers/bools
+    return json.dumps(value)
 
 
 def get_pcluster_status(cluster_name: str, session: boto3.Session) -> str:
     """Get CloudFormation stack status for pcluster."""
-    cfn = session.client("cloudformation")
+    cfn = get_client(session, "cloudformation")
     try:
         response = cfn.describe_stacks(StackName=cluster_name)
         if response["Stacks"]:
@@ -259,17 +547,61 @@ def get_pcluster_status(cluster_name: str, session: boto3.Session) -> str:
     return "NOT_FOUND"
 
 
+def get_stack_progress(
+    cluster_name: str, session: boto3.Session
+) -> tuple[str | None, str | None]:
+    """Return (stack status, most recent event) from one DescribeStackEvents call.
+
+    The stack's own status is its newest event whose LogicalResourceId is the
+    stack name (None if that isn't on the first page); the event is described
+    as e.g. 'HeadNode: CREATE_IN_PROGRESS'.
+    """
+    cfn = get_client(session, "cloudformation")
+    try:
+        events = cfn.describe_stack_events(StackName=cluster_name)["StackEvents"]
+    except ClientError:
+        return None, None
+    if not events:
+        return None, None
+    stack_status = next(
+        (e["ResourceStatus"] for e in events if e["LogicalResourceId"] == cluster_name),
+        None,
+    )
+    return (
+        stack_status,
+        f"{events[0]['LogicalResourceId']}: {events[0]['ResourceStatus']}",
+    )
+
+
+@functools.lru_cache(maxsize=32)
 def get_head_node_id(cluster_name: str, session: boto3.Session) -> str | None:
-    """Fetch Head Node Instance ID from CloudFormation resources."""
-    cfn = session.client("cloudformation")
+    """Fetch Head Node Instance ID from CloudFormation resources (cached per run)."""
+    # gather_inputs/phase 2a record the verified ID in tfvars; trust it for the
+    # same cluster and only fall back to CloudFormation on a miss
+    tfvars = read_tfvars()
+    if tfvars.get("cluster_name") == cluster_name and tfvars.get(
+        "head_node_instance_id"
+    ):
+        return tfvars["head_node_instance_id"]
+
+    cfn = get_client(session, "cloudformation")
     try:
-        response = cfn.describe_stack_resources(StackName=cluster_name)
-        for r in response["StackResources"]:
-            if r["LogicalResourceId"] == "HeadNode":
-                return r["PhysicalResourceId"]
+        response = cfn.describe_stack_resource(
+            StackName=cluster_name, LogicalResourceId="HeadNode"
+        )
+        return response["StackResourceDetail"].get("PhysicalResourceId")
     except ClientError:
-        pass
-    return None
+        return None
+
+
+@functools.lru_cache(maxsize=8)
+def describe_instance(instance_id: str, session: boto3.Session) -> dict | None:
+    """Describe a single EC2 instance (cached, so gather_inputs' lookup of the
+    head node is reused when its SSM permissions are checked)."""
+    resp = get_client(session, "ec2").describe_instances(InstanceIds=[instance_id])
+    if not resp["Reservations"]:
+        return None
+    return resp["Reservations"][0]["Instances"][0]
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -280,7 +612,7 @@ def get_head_node_id(cluster_name: str, session: boto3.Session) -> str | None:
 def phase_1a_config(cluster_name: str, dry_run: bool) -> bool:
     """Phase 1a: Generate Config YAML via Tofu."""
     console.print(Panel("[bold]Phase 1a: Cluster Config[/bold]", border_style="blue"))
-    config_file = Path.cwd() / "generated" / f"{cluster_name}-config.yaml"
+    config_file = GENERATED_DIR.absolute() / f"{cluster_name}-config.yaml"
 
     if config_file.exists():
         console.print(f"[green]✓ Config already exists:[/green] {config_file}")
@@ -290,9 +622,7 @@ def phase_1a_config(cluster_name: str, dry_run: bool) -> bool:
         console.print("[yellow]Dry Run: Would generate config via tofu[/yellow]")
         return True
 
-    # Run tofu init unconditionally to ensure lockfile consistency
-    console.print("[cyan]→ tofu init[/cyan]")
-    if subprocess.run(["tofu", "init"], cwd=Path.cwd()).returncode != 0:
+    if not tofu_init_if_needed():
         return False
 
     return run_tofu(
@@ -300,7 +630,7 @@ def phase_1a_config(cluster_name: str, dry_run: bool) -> bool:
             "apply",
             "-target",
             "module.parallelcluster",
-            "-var-file=generated/terraform.tfvars",
+            f"-var-file={TFVARS_PATH}",
             "-auto-approve",
         ],
         "Generating Cluster Config",
@@ -319,16 +649,14 @@ def phase_1b_create(
         return True
     elif "ROLLBACK" in status or "FAILED" in status:
         console.print(
-            f"[red]❌ Cluster '{cluster_name}' is in failed state: {status}[/red]"
-        )
-        console.print("[yellow]Please delete the failed cluster first:[/yellow]")
-        console.print(
-            f"[dim]  pcluster delete-cluster --cluster-name {cluster_name} --region {region}[/dim]"
+            f"[red]❌ Cluster '{cluster_name}' is in failed state: {status}[/red]\n"
+            "[yellow]Please delete the failed cluster first:[/yellow]\n"
+            f"[dim]  pcluster delete-cluster --cluster-name {cluster_name} --region {region}[/dim]\n"
+            "[dim]Then re-run this installer.[/dim]"
         )
-        console.print("[dim]Then re-run this installer.[/dim]")
         return False
     elif status == "NOT_FOUND":
-        config_file = Path.cwd() / "generated" / f"{cluster_name}-config.yaml"
+        config_file = GENERATED_DIR.absolute() / f"{cluster_name}-config.yaml"
         if not config_file.exists():
             if dry_run:
                 console.print(
@@ -362,8 +690,9 @@ def phase_1b_create(
         # Fall through to wait loop
         status = "CREATE_IN_PROGRESS"
 
-    # Wait Loop
-    if "IN_PROGRESS" in status:
+    # Wait Loop. Only a stack that is being created is waited on:
+    # stack_create_complete also accepts UPDATE_* states as success.
+    if status == "CREATE_IN_PROGRESS":
         console.print(f"[dim]Waiting for cluster creation (Status: {status})...[/dim]")
         with Progress(
             SpinnerColumn(),
@@ -372,19 +701,53 @@ def phase_1b_create(
             console=console,
         ) as progress:
             task = progress.add_task("Creating Cluster...", total=None)
-            while "IN_PROGRESS" in status:
-                time.sleep(30)
-                status = get_pcluster_status(cluster_name, session)
-                progress.update(task, description=f"Cluster Status: {status}")
-                if status == "CREATE_COMPLETE":
-                    console.print("[green]✓ Cluster created successfully![/green]")
-                    return True
-                if "FAILED" in status:
-                    console.print(
-                        f"[red]❌ Cluster creation failed with status: {status}[/red]"
+            cfn = get_client(session, "cloudformation")
+            succeeded = []
+
+            # The waiter decides completion (and bails out early on rollback).
+            # Daemon thread so Ctrl-C isn't held up by an in-flight wait.
+            def wait_for_stack():
+                try:
+                    cfn.get_waiter("stack_create_complete").wait(
+                        StackName=cluster_name,
+                        WaiterConfig={"Delay": 20, "MaxAttempts": 180},
                     )
-                    return False
+                    succeeded.append(True)
+                except (WaiterError, ClientError):
+                    pass
 
+            waiter_thread = threading.Thread(target=wait_for_stack, daemon=True)
+            waiter_thread.start()
+
+            # Meanwhile keep the display fresh, backing off 5s -> 60s since a
+            # cluster create takes tens of minutes. The stack events carry both
+            # the stack's own status (e.g. ROLLBACK_IN_PROGRESS, which the
+            # waiter only reports once the rollback completes) and the latest
+            # resource event, so one call per refresh covers both.
+            refresh = 5.0
+            while waiter_thread.is_alive():
+                stack_status, event = get_stack_progress(cluster_name, session)
+                status = stack_status or status
+                description = f"Cluster Status: {status}"
+                if event:
+                    description += f" [dim]({event})[/dim]"
+                progress.update(task, description=description)
+                waiter_thread.join(timeout=refresh)
+                refresh = min(refresh * 2, 60.0)
+
+            status = get_pcluster_status(cluster_name, session)
+            if not succeeded or status != "CREATE_COMPLETE":
+                console.print(
+                    f"[red]❌ Cluster creation failed with status: {status}[/red]"
+                )
+                return False
+
+            console.print("[green]✓ Cluster created successfully![/green]")
+            return True
+
+    console.print(
+        f"[red]❌ Cluster '{cluster_name}' is not being created (status: {status})[/red]"
+    )
     return False
 
 
@@ -397,11 +760,6 @@ def phase_2a_connect_infra(
     # 1. Fetch Head Node ID (Dynamic Check)
     head_node_id = get_head_node_id(cluster_name, session)
 
-    # Ensure tofu is initialized (critical for "Existing Cluster" path which skips Phase 1a)
-    if not dry_run:
-        console.print("[cyan]→ tofu init[/cyan]")
-        subprocess.run(["tofu", "init"], cwd=Path.cwd(), capture_output=True)
-
     if not head_node_id:
         if dry_run:
             console.print(
@@ -416,9 +774,18 @@ def phase_2a_connect_infra(
 
     console.print(f"[dim]Head Node ID: {head_node_id}[/dim]")
 
-    # 2. FRONTLOAD: Attach SSM policy early (agent registers during Tofu apply)
+    # 2. FRONTLOAD: Attach SSM policy early (agent registers during Tofu apply).
+    # Independent of tofu init (critical for "Existing Cluster" path which skips
+    # Phase 1a), so the IAM calls run while init does.
     if not dry_run:
-        if not ensure_ssm_permissions(head_node_id, session):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            init_future = executor.submit(tofu_init_if_needed, capture_output=True)
+            ssm_ok = ensure_ssm_permissions(head_node_id, session)
+            init_ok = init_future.result()
+        if not init_ok:
+            # Stop before tfvars/apply; the captured init error was printed
+            return False
+        if not ssm_ok:
             console.print(
                 "[red]❌ Failed to attach SSM policy to head node. Cannot proceed.[/red]"
             )
@@ -440,7 +807,7 @@ def phase_2a_connect_infra(
             "apply",
             "-target",
             "module.connectivity",
-            "-var-file=generated/terraform.tfvars",
+            f"-var-file={TFVARS_PATH}",
             "-auto-approve",
         ],
         "Deploying Connectivity",
@@ -466,28 +833,48 @@ def phase_2b_connect_ssm(cluster_name: str, session: boto3.Session) -> bool:
         return False
 
     # Quick SSM check - should already be ready after Phase 2a
-    if not wait_for_ssm_ready(head_node_id, session, timeout=30):
-        console.print("[yellow]⚠ SSM not ready yet, waiting 60s more...[/yellow]")
-        time.sleep(60)
+    try:
         if not wait_for_ssm_ready(head_node_id, session, timeout=30):
-            console.print(
-                "[red]❌ SSM agent not registered. Check instance IAM role and network connectivity.[/red]"
+            console.print("[yellow]⚠ SSM not ready yet, waiting 60s more...[/yellow]")
+            time.sleep(60)
+            if not wait_for_ssm_ready(head_node_id, session, timeout=30):
+                console.print(
+                    "[red]❌ SSM agent not registered. Check instance IAM role and network connectivity.[/red]"
+                )
+                return False
+    except ClientError as e:
+        console.print(f"[red]❌ Cannot query SSM agent status: {e}[/red]")
+        return False
+
+    onboarding = get_tofu_output("clusterra_onboarding", as_json=True) or {}
+    jwt_secret_arn = onboarding.get("slurm_jwt_secret_arn")
+    if not jwt_secret_arn:
+        console.print("[red]❌ Missing JWT Secret ARN in Tofu output[/red]")
+        return False
+
+    # Check if port 6830 is listening; the head node's JWT key is read in the
+    # same SSM round-trip, and the Secrets Manager copy is fetched meanwhile
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        sm_key_future = executor.submit(fetch_jwt_secret, jwt_secret_arn, session)
+        checks = (
+            send_ssm_batch(
+                head_node_id,
+                {"port": SLURMRESTD_PORT_CHECK, "jwt_key": JWT_KEY_READ},
+                session,
             )
-            return False
+            or {}
+        )
+        sm_key = sm_key_future.result()
+    if sm_key is None:
+        return False
 
-    # Check if port 6830 is listening
-    if not verify_slurmrestd(head_node_id, session):
+    head_key = None
+    if "OPEN" not in checks.get("port", ""):
         console.print("[dim]Configuring slurmrestd on head node...[/dim]")
-        onboarding = get_tofu_output("clusterra_onboarding", as_json=True) or {}
-        jwt_secret = onboarding.get("slurm_jwt_secret_arn")
-        if not jwt_secret:
-            console.print("[red]❌ Missing JWT Secret in Tofu output[/red]")
-            return False
-
         run_ssm_script(
             head_node_id,
             "modules/cluster-connect/scripts/setup-slurmrestd.sh",
-            [jwt_secret],
+            [jwt_secret_arn],
             session,
         )
         if not verify_slurmrestd(head_node_id, session):
@@ -495,15 +882,12 @@ def phase_2b_connect_ssm(cluster_name: str, session: boto3.Session) -> bool:
             return False
     else:
         console.print("[green]✓ slurmrestd is listening[/green]")
+        head_key = checks.get("jwt_key")
 
     # CRITICAL: Verify JWT key sync before declaring success
-    onboarding = get_tofu_output("clusterra_onboarding", as_json=True) or {}
-    jwt_secret_arn = onboarding.get("slurm_jwt_secret_arn")
-    if not jwt_secret_arn:
-        console.print("[red]❌ Missing JWT Secret ARN in Tofu output[/red]")
-        return False
-
-    if not verify_jwt_key_sync(head_node_id, jwt_secret_arn, session):
+    if not verify_jwt_key_sync(
+        head_node_id, jwt_secret_arn, session, head_key=head_key, sm_key=sm_key
+    ):
         console.print(
             "[red]❌ JWT key verification failed. Installation cannot proceed.[/red]"
         )
@@ -524,11 +908,13 @@ def phase_4_register(
     session: boto3.Session,
 ) -> bool:
     """Phase 4: Register with Clusterra API."""
+    import requests
+
     console.print(Panel("[bold]Phase 4: Registration[/bold]", border_style="blue"))
 
     # Check if already registered (using explicit flag, not cluster_id presence)
-    tfvars = Path("generated/terraform.tfvars").read_text()
-    if 'registered = "true"' in tfvars:
+    tfvars = read_tfvars()
+    if tfvars.get("registered") == "true":
         console.print("[green]✓ Already registered with Clusterra API[/green]")
         return True
 
@@ -537,18 +923,21 @@ def phase_4_register(
         return True
 
     # Get cluster_id from tfvars (generated earlier in gather_inputs)
-    cluster_id = None
-    for line in tfvars.split("\n"):
-        if line.strip().startswith("cluster_id"):
-            # Parse: cluster_id = "clus1234"
-            cluster_id = line.split("=")[1].strip().strip('"')
-            break
+    cluster_id = tfvars.get("cluster_id")
 
     if not cluster_id:
         console.print("[red]❌ cluster_id not found in tfvars[/red]")
         return False
 
-    onboarding = get_tofu_output("clusterra_onboarding", as_json=True) or {}
+    # The tofu output subprocess and STS presigning are independent
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        onboarding_future = executor.submit(
+            get_tofu_output, "clusterra_onboarding", True
+        )
+        sts_future = executor.submit(generate_sts_token, session)
+        onboarding = onboarding_future.result() or {}
+        # STS token for AWS account verification
+        sts_token = sts_future.result()
 
     if not onboarding.get("lattice_service_endpoint"):
         console.print("[red]❌ Missing Lattice Endpoint. Did Phase 2a finish?[/red]")
@@ -569,15 +958,12 @@ def phase_4_register(
         "head_node_instance_id": onboarding.get("head_node_instance_id"),
     }
 
-    # Generate STS token for AWS account verification
-    sts_token = generate_sts_token(session)
-
     url = f"{api_url}/v1/internal/connect/{tenant_id}"
     console.print(f"[cyan]→ POST {url}[/cyan]")
 
     # 1st Attempt: Register cluster (also triggers RAM share principal addition)
     try:
-        resp = requests.post(
+        resp = get_http_session().post(
             url, json=payload, headers={"X-AWS-STS-Token": sts_token}, timeout=30
         )
     except requests.exceptions.Timeout:
@@ -631,30 +1017,20 @@ def accept_ram_invitation(
 ) -> bool:
     """Check for and accept the Clusterra service network RAM invitation.
 
-    Returns True if:
-      - We can already access the service network (RAM share accepted previously), OR
-      - The invitation was just accepted.
+    The caller (wait_for_ram_acceptance) checks service network visibility
+    itself, so this only looks at invitations.
+
+    Returns True if the invitation is accepted (previously or just now).
     Returns False if no invitation found yet (caller should retry).
     """
-    # First, check if we already have access to the service network
+    ram = get_client(session, "ram")
     try:
-        lattice = session.client("vpc-lattice")
-        resp = lattice.get_service_network(serviceNetworkIdentifier=service_network_id)
-        if resp.get("id") == service_network_id or resp.get("arn"):
-            console.print(
-                f"[green]✓ Service network {service_network_id} is accessible (RAM share already accepted)[/green]"
-            )
-            return True
-    except Exception as e:
-        # AccessDeniedException means we don't have access yet - that's ok, continue to check invitations
-        if "AccessDeniedException" not in str(e):
-            console.print(f"[dim]Service network not accessible: {e}[/dim]")
-
-    # Check for pending RAM invitations
-    ram = session.client("ram")
-    try:
-        resp = ram.get_resource_share_invitations()
-        invites = resp.get("resourceShareInvitations", [])
+        invites = (
+            ram.get_paginator("get_resource_share_invitations")
+            .paginate()
+            .build_full_result()
+            .get("resourceShareInvitations", [])
+        )
 
         # Find the MOST RECENT invitation matching name + sender account
         latest_invite = None
@@ -688,7 +1064,10 @@ def accept_ram_invitation(
                 f"[yellow]⚡ Found pending RAM invitation from {CLUSTERRA_SERVICE_ACCOUNT_ID}[/yellow]"
             )
             console.print(f"[dim]Accepting {arn}...[/dim]")
-            ram.accept_resource_share_invitation(resourceShareInvitationArn=arn)
+            # clientToken makes botocore's automatic retries of this call idempotent
+            ram.accept_resource_share_invitation(
+                resourceShareInvitationArn=arn, clientToken=str(uuid4())
+            )
             console.print("[green]✓ Accepted RAM invitation[/green]")
             time.sleep(5)  # Allow propagation
             return True
@@ -706,8 +1085,12 @@ def wait_for_ram_acceptance(
     timeout: int = 300,
 ) -> bool:
     """Poll for RAM invitation and accept it, or confirm we already have access."""
-    elapsed = 0
-    interval = 10
+    elapsed = 0.0
+    # Back off 3s -> 30s: early checks catch a quick share, later ones
+    # don't hammer RAM/Lattice while the control plane catches up.
+    interval = 3.0
+    lattice = get_client(session, "vpc-lattice")
+    accepted = False
 
     with Progress(
         SpinnerColumn(),
@@ -720,7 +1103,6 @@ def wait_for_ram_acceptance(
         while elapsed < timeout:
             # First, check if network is ACTUALLY visible (ultimate success)
             try:
-                lattice = session.client("vpc-lattice")
                 resp = lattice.get_service_network(
                     serviceNetworkIdentifier=service_network_id
                 )
@@ -729,17 +1111,24 @@ def wait_for_ram_acceptance(
                         f"[green]✓ Service Network {service_network_id} is visible[/green]"
                     )
                     return True
-            except Exception:
-                pass
-
-            # If not visible, ensure invitation is accepted
-            accept_ram_invitation(session, service_network_id)
-
-            time.sleep(interval)
-            elapsed += interval
+            except ClientError as e:
+                # AccessDeniedException just means the share isn't active yet
+                if e.response.get("Error", {}).get("Code") != "AccessDeniedException":
+                    console.print(f"[dim]Service network not accessible: {e}[/dim]")
+
+            # If not visible, accept the invitation once it shows up; after
+            # that only visibility is polled while the share propagates.
+            if not accepted:
+                accepted = accept_ram_invitation(session, service_network_id)
+
+            # Jitter so concurrent installers don't poll in lockstep
+            delay = interval * random.uniform(0.7, 1.3)
+            time.sleep(delay)
+            elapsed += delay
+            interval = min(interval * 1.5, 30.0)
             progress.update(
                 task,
-                description=f"Waiting for Service Network visibility... ({elapsed}s)",
+                description=f"Waiting for Service Network visibility... ({elapsed:.0f}s)",
             )
 
     return False
@@ -749,7 +1138,7 @@ def associate_lattice_service(
     session: boto3.Session, service_arn: str, service_network_id: str
 ) -> bool:
     """Associate the local Lattice Service with the Clusterra Service Network."""
-    lattice = session.client("vpc-lattice")
+    lattice = get_client(session, "vpc-lattice")
     console.print(
         f"[dim]Associating service {service_arn} with network {service_network_id}...[/dim]"
     )
@@ -775,7 +1164,7 @@ def associate_lattice_service(
 
 def dissociate_lattice_service(session: boto3.Session, service_arn: str) -> bool:
     """Dissociate the Lattice Service from any service networks before destroy."""
-    lattice = session.client("vpc-lattice")
+    lattice = get_client(session, "vpc-lattice")
     try:
         # Find all associations for this service
         resp = lattice.list_service_network_service_associations(
@@ -823,23 +1212,36 @@ def cleanup_resources(session: boto3.Session):
             "destroy",
             "-target",
             "module.connectivity",
-            "-var-file=generated/terraform.tfvars",
+            f"-var-file={TFVARS_PATH}",
             "-auto-approve",
         ],
         "Rolling Back Connectivity",
     )
 
 
+@functools.lru_cache(maxsize=1)
+def get_http_session():
+    """Shared requests session for the Clusterra API.
+
+    Pools connections and retries failed connects with backoff. Read errors
+    and error statuses are not retried: registration is a non-idempotent
+    POST, and a read timeout is expected while the RAM share is pending.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    http = requests.Session()
+    retry = Retry(total=3, connect=3, read=False, backoff_factor=0.5)
+    http.mount("https://", HTTPAdapter(max_retries=retry))
+    return http
+
+
 def generate_sts_token(session: boto3.Session) -> str:
     """
     Generate presigned STS GetCallerIdentity token for AWS account verification.
     The server executes this presigned request to verify we own the AWS account.
     """
-    import base64
-    import json
-    from botocore.auth import SigV4Auth
-    from botocore.awsrequest import AWSRequest
-
     region = session.region_name or "us-east-1"
     url = f"https://sts.{region}.amazonaws.com/"
 
@@ -849,7 +1251,10 @@ def generate_sts_token(session: boto3.Session) -> str:
         data="Action=GetCallerIdentity&Version=2011-06-15",
         headers={"Content-Type": "application/x-www-form-urlencoded"},
     )
-    SigV4Auth(session.get_credentials(), "sts", region).add_auth(request)
+    # Sign with one consistent snapshot of refreshable (e.g. SSO/assumed-role)
+    # credentials rather than the live object
+    credentials = session.get_credentials().get_frozen_credentials()
+    SigV4Auth(credentials, "sts", region).add_auth(request)
 
     token_data = {
         "url": request.url,
@@ -857,7 +1262,10 @@ def generate_sts_token(session: boto3.Session) -> str:
         "body": request.data,
     }
 
-    return base64.b64encode(json.dumps(token_data).encode()).decode()
+    # Compact separators keep the X-AWS-STS-Token header small
+    return base64.b64encode(
+        json.dumps(token_data, separators=(",", ":")).encode()
+    ).decode()
 
 
 def phase_3_events_hooks(
@@ -905,89 +1313,122 @@ def phase_3_events_hooks(
 
 
 def update_tfvars(updates: dict):
-    path = Path("generated/terraform.tfvars")
-    if not path.exists():
-        path.write_text("")
-    content = path.read_text()
+    """Set keys in terraform.tfvars, replacing existing assignments in place."""
+    path = TFVARS_PATH
+    original = path.read_text() if path.exists() else ""
+    lines = original.splitlines()
+
+    # Single pass: map each assigned key to its line number
+    positions = {}
+    for i, line in enumerate(lines):
+        match = TFVAR_RE.match(line)
+        if match:
+            positions.setdefault(match.group(1), i)
+
+    for k, v in updates.items():
+        entry = f'{k} = "{v}"'
+        if k in positions:
+            lines[positions[k]] = entry
+        else:
+            positions[k] = len(lines)
+            lines.append(entry)
+
+    # Re-runs usually set the same values again; leaving the file untouched
+    # keeps read_tfvars' parse cache (keyed on inode/mtime) valid
+    text = "\n".join(lines) + "\n"
+    if text != original:
+        write_text_atomic(path, text)
+
 
-    with path.open("a") as f:
-        for k, v in updates.items():
-            if f"{k} =" not in content:
-                f.write(f'\n{k} = "{v}"')
+def write_text_atomic(path: Path, text: str):
+    """Write a file via a temp file + rename so readers never see a partial file."""
+    tmp = path.with_name(f"{path.name}.tmp")
+    tmp.write_text(text)
+    os.replace(tmp, path)
 
 
 def read_tfvars() -> dict:
-    """Read terraform.tfvars and return as dict."""
-    path = Path("generated/terraform.tfvars")
-    if not path.exists():
+    """Read terraform.tfvars and return as dict (re-parsed only when it changes)."""
+    try:
+        st = TFVARS_PATH.stat()
+    except FileNotFoundError:
         return {}
+    # Writes go through write_text_atomic (new inode), so this key always moves
+    return dict(_parse_tfvars(st.st_ino, st.st_mtime_ns, st.st_size))
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_tfvars(ino: int, mtime_ns: int, size: int) -> dict:
+    text = TFVARS_PATH.read_text()
+    return {key: value.strip() for key, value in TFVAR_RE.findall(text)}
+
 
-    result = {}
-    for line in path.read_text().splitlines():
-        line = line.strip()
-        if "=" in line and not line.startswith("#"):
-            key, value = line.split("=", 1)
-            key = key.strip()
-            value = value.strip().strip('"')
-            result[key] = value
-    return result
+# A bare TCP connect needs no root and doesn't enumerate every socket
+SLURMRESTD_PORT_CHECK = (
+    "bash -c 'exec 3<>/dev/tcp/127.0.0.1/6830' 2>/dev/null && echo OPEN || echo CLOSED"
+)
+JWT_KEY_READ = "cat /opt/slurm/etc/jwt_hs256.key 2>/dev/null || echo KEY_NOT_FOUND"
 
 
 def verify_slurmrestd(instance_id: str, session: boto3.Session) -> bool:
     """Check if port 6830 is open via SSM."""
-    cmd = "sudo ss -tlnp | grep 6830"
-    success, res = send_ssm_command(instance_id, [cmd], session)
-    return success and res and "6830" in res
+    success, res = send_ssm_command(instance_id, [SLURMRESTD_PORT_CHECK], session)
+    return success and res and "OPEN" in res
+
+
+def fetch_jwt_secret(jwt_secret_arn: str, session: boto3.Session) -> str | None:
+    """Read the slurmrestd JWT key from Secrets Manager (None on failure)."""
+    sm = get_client(session, "secretsmanager")
+    try:
+        resp = sm.get_secret_value(SecretId=jwt_secret_arn)
+        return resp["SecretString"].strip()
+    except Exception as e:
+        console.print(
+            f"[red]❌ Failed to read JWT secret from Secrets Manager: {e}[/red]"
+        )
+        return None
 
 
 def verify_jwt_key_sync(
-    instance_id: str, jwt_secret_arn: str, session: boto3.Session
+    instance_id: str,
+    jwt_secret_arn: str,
+    session: boto3.Session,
+    head_key: str | None = None,
+    sm_key: str | None = None,
 ) -> bool:
     """Verify JWT key on head node matches Secrets Manager.
 
     This is a CRITICAL check - if keys don't match, Slurm auth WILL fail.
+    Pass head_key if the key file was already read (see send_ssm_batch), and
+    sm_key if the secret was already fetched (see fetch_jwt_secret).
     """
     console.print("[dim]Verifying JWT key synchronization...[/dim]")
 
     # 1. Get key from Secrets Manager
-    sm = session.client("secretsmanager")
-    try:
-        resp = sm.get_secret_value(SecretId=jwt_secret_arn)
-        sm_key = resp["SecretString"].strip()
-    except Exception as e:
-        console.print(
-            f"[red]❌ Failed to read JWT secret from Secrets Manager: {e}[/red]"
-        )
-        return False
+    if sm_key is None:
+        sm_key = fetch_jwt_secret(jwt_secret_arn, session)
+        if sm_key is None:
+            return False
 
     # 2. Get key from head node via SSM
-    success, output = send_ssm_command(
-        instance_id,
-        ["cat /opt/slurm/etc/jwt_hs256.key 2>/dev/null || echo KEY_NOT_FOUND"],
-        session,
-    )
-
-    if not success or not output:
-        console.print("[red]❌ Failed to read JWT key from head node[/red]")
-        return False
-
-    head_key = output.strip()
+    if head_key is None:
+        success, output = send_ssm_command(instance_id, [JWT_KEY_READ], session)
+        if not success or not output:
+            console.print("[red]❌ Failed to read JWT key from head node[/red]")
+            return False
+        head_key = output.strip()
 
     if head_key == "KEY_NOT_FOUND":
         console.print("[red]❌ JWT key file not found on head node[/red]")
         return False
 
     # 3. Compare keys
-    if head_key != sm_key:
-        console.print("[red]❌ JWT KEY MISMATCH DETECTED![/red]")
-        console.print(
-            f"[red]  Secrets Manager: {sm_key[:16]}...{sm_key[-8:]} ({len(sm_key)} chars)[/red]"
-        )
+    if not hmac.compare_digest(head_key.encode(), sm_key.encode()):
         console.print(
-            f"[red]  Head Node:       {head_key[:16]}...{head_key[-8:]} ({len(head_key)} chars)[/red]"
-        )
-        console.print(
-            "[red]This WILL cause 'Protocol authentication error' when submitting jobs.[/red]"
+            "[red]❌ JWT KEY MISMATCH DETECTED!\n"
+            f"  Secrets Manager: {sm_key[:16]}...{sm_key[-8:]} ({len(sm_key)} chars)\n"
+            f"  Head Node:       {head_key[:16]}...{head_key[-8:]} ({len(head_key)} chars)\n"
+            "This WILL cause 'Protocol authentication error' when submitting jobs.[/red]"
         )
         return False
 
@@ -995,21 +1436,24 @@ def verify_jwt_key_sync(
     return True
 
 
+@functools.lru_cache(maxsize=16)
+def encode_script(path_str: str, mtime: float) -> str:
+    """Base64-encode a script file; keyed on mtime so edits are picked up."""
+    return base64.b64encode(Path(path_str).read_bytes()).decode()
+
+
 def run_ssm_script(
     instance_id: str, script_rel_path: str, args: list, session: boto3.Session
 ) -> bool:
     """Read a local script and run it on instance via SSM using base64 encoding."""
-    import base64
-
     path = Path.cwd() / script_rel_path
     if not path.exists():
         console.print(f"[red]❌ Script not found: {path}[/red]")
         return False
 
-    content = path.read_text()
     # Base64 encode the script to avoid heredoc/escaping issues
-    encoded = base64.b64encode(content.encode()).decode()
-    arg_str = " ".join([f"'{a}'" for a in args])
+    encoded = encode_script(str(path), path.stat().st_mtime)
+    arg_str = shlex.join(map(str, args))
 
     # Single command that decodes and runs the script
     commands = [
@@ -1030,6 +1474,26 @@ def run_ssm_script(
         return False
 
 
+def stage_to_s3(session: boto3.Session, file_obj) -> tuple[str, str] | None:
+    """Stream a file object to the connectivity scratch bucket.
+
+    Returns (bucket, key), or None if no scratch bucket is deployed or the
+    upload fails (caller falls back to inlining the payload).
+    """
+    onboarding = get_tofu_output("clusterra_onboarding", as_json=True) or {}
+    bucket = onboarding.get("scratch_bucket")
+    if not bucket:
+        return None
+
+    key = f"packages/{uuid4().hex}.tar.gz"
+    try:
+        get_client(session, "s3").upload_fileobj(file_obj, bucket, key)
+    except (ClientError, S3UploadFailedError) as e:
+        console.print(f"[dim]S3 staging unavailable, sending inline: {e}[/dim]")
+        return None
+    return bucket, key
+
+
 def run_ssm_script_package(
     instance_id: str,
     folder_rel_path: str,
@@ -1038,10 +1502,6 @@ def run_ssm_script_package(
     session: boto3.Session,
 ) -> bool:
     """Bundle a folder and run a script from it on the instance."""
-    import base64
-    import tarfile
-    import io
-
     path = Path.cwd() / folder_rel_path
     if not path.exists():
         console.print(f"[red]❌ Script folder not found: {path}[/red]")
@@ -1054,26 +1514,45 @@ def run_ssm_script_package(
         # Let's put them inside a dir named after folder
         tar.add(path, arcname=path.name)
 
-    file_obj.seek(0)
-    encoded = base64.b64encode(file_obj.read()).decode()
-
-    arg_str = " ".join([f"'{a}'" for a in args])
+    arg_str = shlex.join(map(str, args))
     # The tar will unpack into its own directory name (path.name)
     remote_src_dir = f"/tmp/{path.name}"
 
-    # Command to:
+    # Prefer staging via the scratch bucket: SSM command parameters are
+    # size-limited and base64 inflates the payload by a third.
+    file_obj.seek(0)
+    staged = stage_to_s3(session, file_obj)
+    if staged:
+        bucket, key = staged
+        region_flag = f" --region {session.region_name}" if session.region_name else ""
+        # Piped straight into tar: no temp archive on the head node
+        fetch_cmd = f"aws s3 cp s3://{bucket}/{key} -{region_flag} | tar -xz -C /tmp"
+    else:
+        encoded = base64.b64encode(file_obj.getbuffer()).decode()
+        fetch_cmd = f"cd /tmp && echo '{encoded}' | base64 -d | tar -xz"
+
+    # One command so a failed step stops the chain:
     # 1. Clean old dir
-    # 2. Decode and untar
+    # 2. Fetch (S3 or inline) and untar
     # 3. Exec main script
-    commands = [
+    steps = [
         f"rm -rf {remote_src_dir}",
-        f"cd /tmp && echo '{encoded}' | base64 -d | tar -xz",
+        fetch_cmd,
         f"chmod +x {remote_src_dir}/*",
         f"sudo bash {remote_src_dir}/{main_script_name} {arg_str}",
     ]
+    # AWS-RunShellScript runs under sh (dash on Ubuntu), which has no pipefail
+    commands = ["bash -c " + shlex.quote("set -euo pipefail; " + " && ".join(steps))]
 
     console.print(f"[dim]Deploying package {path.name} to {instance_id}...[/dim]")
-    success, output = send_ssm_command(instance_id, commands, session)
+    try:
+        success, output = send_ssm_command(instance_id, commands, session)
+    finally:
+        if staged:
+            try:
+                get_client(session, "s3").delete_object(Bucket=bucket, Key=key)
+            except ClientError as e:
+                console.print(f"[dim]Could not remove staged package: {e}[/dim]")
 
     if success:
         console.print("[green]✓ Package executed successfully[/green]")
@@ -1087,11 +1566,62 @@ def run_ssm_script_package(
         return False
 
 
+def send_ssm_batch(
+    instance_id: str, commands: dict[str, str], session: boto3.Session
+) -> dict[str, str] | None:
+    """Run independent shell snippets in one SSM invocation.
+
+    Returns each snippet's stdout keyed by name, or None if the command failed.
+    """
+    lines = []
+    for name, cmd in commands.items():
+        lines += [f"echo '---MARK:{name}---'", cmd]
+    success, output = send_ssm_command(instance_id, lines, session)
+    if not success or output is None:
+        return None
+
+    results = {}
+    for section in output.split("---MARK:")[1:]:
+        name, _, body = section.partition("---\n")
+        results[name] = body.strip()
+    return results
+
+
+SSM_FAILED_STATUSES = ("Failed", "Cancelled", "TimedOut")
+
+
+def poll_command_briefly(ssm, cmd_id: str, instance_id: str, budget: float = 2.0):
+    """Poll a just-sent SSM command for up to `budget` seconds.
+
+    Short commands (port checks, key reads) finish in well under a second. The
+    command_executed waiter polls every 3s, so one that is still running on
+    the waiter's first check costs a full interval; checking from 100ms up
+    catches it as it finishes.
+    Returns the invocation once it reaches a terminal status, else None.
+    """
+    delay = 0.1
+    deadline = time.monotonic() + budget
+    while time.monotonic() < deadline:
+        time.sleep(delay)
+        delay = min(delay * 1.5, 1.0)
+        try:
+            inv = ssm.get_command_invocation(CommandId=cmd_id, InstanceId=instance_id)
+        except ClientError as e:
+            # Not visible yet right after send_command
+            if e.response.get("Error", {}).get("Code") == "InvocationDoesNotExist":
+                continue
+            raise
+        if inv["Status"] == "Success" or inv["Status"] in SSM_FAILED_STATUSES:
+            return inv
+    return None
+
+
 def send_ssm_command(
     instance_id: str, commands: list, session: boto3.Session
 ) -> tuple[bool, str | None]:
-    ssm = session.client("ssm")
+    ssm = get_client(session, "ssm")
     retries = 3
+    started = time.monotonic()
     for attempt in range(retries):
         try:
             resp = ssm.send_command(
@@ -1101,29 +1631,41 @@ def send_ssm_command(
             )
             cmd_id = resp["Command"]["CommandId"]
 
-            # Wait
-            time.sleep(2)
-            for _ in range(30):  # 60s timeout
+            inv = poll_command_briefly(ssm, cmd_id, instance_id)
+            if inv is None:
+                # Still running: botocore's waiter takes over at a steady 3s
+                # cadence and stops on any terminal status.
+                try:
+                    ssm.get_waiter("command_executed").wait(
+                        CommandId=cmd_id,
+                        InstanceId=instance_id,
+                        WaiterConfig={"Delay": 3, "MaxAttempts": 40},
+                    )
+                except WaiterError as e:
+                    if attempt < retries - 1:
+                        continue  # Retry command
+                    inv = e.last_response or {}
+                    if inv.get("Status") in SSM_FAILED_STATUSES:
+                        return False, inv.get(
+                            "StandardErrorContent", ""
+                        ) or "Command failed"
+                    return False, "Timed out waiting for execution"
+
                 inv = ssm.get_command_invocation(
                     CommandId=cmd_id, InstanceId=instance_id
                 )
-                if inv["Status"] == "Success":
-                    return True, inv["StandardOutputContent"]
-                elif inv["Status"] in ["Failed", "Cancelled", "TimedOut"]:
-                    if attempt < retries - 1:
-                        break  # Retry command
-                    return False, inv.get(
-                        "StandardErrorContent", ""
-                    ) or "Command failed"
-                time.sleep(2)
-            if attempt == retries - 1:
-                return False, "Timed out waiting for execution"
-
-        except Exception as e:
-            msg = str(e)
-            if "InvalidInstanceId" in msg and attempt < retries - 1:
+            elif inv["Status"] != "Success":
+                if attempt < retries - 1:
+                    continue  # Retry command
+                return False, inv.get("StandardErrorContent", "") or "Command failed"
+
+            return True, inv["StandardOutputContent"]
+
+        except ClientError as e:
+            code = e.response.get("Error", {}).get("Code")
+            if code == "InvalidInstanceId" and attempt < retries - 1:
                 console.print(
-                    f"[dim]SSM Agent not ready, retrying ({attempt+1}/{retries})...[/dim]"
+                    f"[dim]SSM Agent not ready, retrying ({attempt + 1}/{retries}, {time.monotonic() - started:.0f}s elapsed)...[/dim]"
                 )
                 time.sleep(10)
                 continue
@@ -1137,17 +1679,15 @@ def ensure_ssm_permissions(instance_id: str, session: boto3.Session) -> bool:
 
     Returns True if policy is attached successfully, False otherwise.
     """
-    ec2 = session.client("ec2")
-    iam = session.client("iam")
+    iam = get_client(session, "iam")
 
     try:
         # Get IAM role from instance profile
-        resp = ec2.describe_instances(InstanceIds=[instance_id])
-        if not resp["Reservations"]:
+        instance = describe_instance(instance_id, session)
+        if instance is None:
             console.print("[red]❌ Instance not found[/red]")
             return False
 
-        instance = resp["Reservations"][0]["Instances"][0]
         if "IamInstanceProfile" not in instance:
             console.print(
                 "[red]❌ No IAM Instance Profile found on head node. Cannot attach SSM policy.[/red]"
@@ -1166,15 +1706,34 @@ def ensure_ssm_permissions(instance_id: str, session: boto3.Session) -> bool:
 
         role_name = roles[0]["RoleName"]
 
-        # Attach Policy
+        # Attach Policy, unless a previous run already did
         policy_arn = "arn:aws:iam::aws:policy/AmazonSSMManagedInstanceCore"
+        attached = {
+            p["PolicyArn"]
+            for p in iam.get_paginator("list_attached_role_policies")
+            .paginate(RoleName=role_name)
+            .build_full_result()["AttachedPolicies"]
+        }
+        if policy_arn in attached:
+            console.print(
+                f"[green]✓ SSM policy already attached to {role_name}[/green]"
+            )
+            return True
+
         console.print(f"[dim]Attaching SSM policy to role {role_name}...[/dim]")
         iam.attach_role_policy(RoleName=role_name, PolicyArn=policy_arn)
         console.print(f"[green]✓ SSM policy attached to {role_name}[/green]")
         return True
 
-    except Exception as e:
-        console.print(f"[red]❌ Failed to attach SSM policy: {e}[/red]")
+    except ClientError as e:
+        code = e.response.get("Error", {}).get("Code")
+        if code in ("AccessDenied", "UnauthorizedOperation"):
+            console.print(
+                "[red]❌ Not authorized to update the head node's IAM role. "
+                "Attach AmazonSSMManagedInstanceCore manually or use a profile with IAM permissions.[/red]"
+            )
+        else:
+            console.print(f"[red]❌ Failed to attach SSM policy: {e}[/red]")
         return False
 
 
@@ -1182,53 +1741,84 @@ def wait_for_ssm_ready(
     instance_id: str, session: boto3.Session, timeout: int = 30
 ) -> bool:
     """Wait for SSM agent to register with the service."""
-    ssm = session.client("ssm")
-    elapsed = 0
-    interval = 5
+    ssm = get_client(session, "ssm")
+    deadline = time.monotonic() + timeout
+    # Back off 0.5s -> 5s: an agent that is about to register is seen almost
+    # immediately, a slow one doesn't cost a call every few seconds.
+    interval = 0.5
 
-    while elapsed < timeout:
+    while time.monotonic() < deadline:
         try:
+            # Filter on PingStatus server-side: any row back means online.
             response = ssm.describe_instance_information(
-                Filters=[{"Key": "InstanceIds", "Values": [instance_id]}]
+                Filters=[
+                    {"Key": "InstanceIds", "Values": [instance_id]},
+                    {"Key": "PingStatus", "Values": ["Online"]},
+                ],
+                MaxResults=5,  # API minimum; at most one row can match
             )
             if response.get("InstanceInformationList"):
-                info = response["InstanceInformationList"][0]
-                if info.get("PingStatus") == "Online":
-                    console.print("[green]✓ SSM agent is online[/green]")
-                    return True
-        except Exception:
-            pass
-        time.sleep(interval)
-        elapsed += interval
+                console.print("[green]✓ SSM agent is online[/green]")
+                return True
+        except ClientError as e:
+            code = e.response.get("Error", {}).get("Code")
+            if code in ("AccessDeniedException", "AccessDenied"):
+                # Retrying can't fix missing permissions; fail now, not at timeout
+                raise
+            if code == "ThrottlingException":
+                console.print("[dim]SSM throttled, backing off...[/dim]")
+                interval = 5.0
+        time.sleep(min(interval, max(deadline - time.monotonic(), 0)))
+        interval = min(interval * 1.7, 5.0)
 
     return False
 
 
-def gather_inputs(session: boto3.Session):
-    """Interactive input gathering with validation."""
+def validate_required(val: str):
+    return len(val.strip()) > 0 or "This field is required"
+
+
+def validate_cluster_id(val: str):
+    return bool(CLUSTER_ID_RE.fullmatch(val.strip())) or (
+        "Must be 'clus' followed by 4 hex chars (e.g., clusa1b2)"
+    )
+
+
+def vpc_label(v: dict) -> str:
+    return f"{v['id']} ({v['name']})"
 
-    # Load existing vars if any
-    existing_vars = {}
-    if Path("generated/terraform.tfvars").exists():
-        import re
-
-        content = Path("generated/terraform.tfvars").read_text()
-        for line in content.splitlines():
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            match = re.match(r'(\w+)\s*=\s*"?([^"]*)"?', line)
-            if match:
-                existing_vars[match.group(1)] = match.group(2)
 
-    # Validator
-    def validate_required(val):
-        return len(val.strip()) > 0 or "This field is required"
+def subnet_label(s: dict) -> str:
+    return f"{s['id']} ({s['name']} - {s['az']})"
 
-    def validate_cluster_id(val):
-        return (
-            len(val.strip()) == 8 and val.startswith("clus")
-        ) or "Must be 8 chars starting with 'clus' (e.g., clusa1b2)"
+
+def gather_inputs(session: boto3.Session) -> dict:
+    """Interactive input gathering with validation.
+
+    Writes generated/terraform.tfvars and returns the values written.
+    """
+    import questionary
+
+    prompt_style = questionary.Style(PROMPT_STYLE_RULES)
+
+    def as_choices(items: list[dict], label) -> list:
+        return [questionary.Choice(label(i), value=i["id"]) for i in items]
+
+    GENERATED_DIR.mkdir(parents=True, exist_ok=True)
+
+    # Load existing vars if any
+    existing_vars = read_tfvars()
+
+    # Start the inventory lookups before the first prompt so they run while
+    # the user answers; results are collected where they're needed. Subnets
+    # depend on the VPC choice, so only the previously used VPC's are fetched.
+    prev_vpc = existing_vars.get("vpc_id")
+    prefetch = ThreadPoolExecutor(max_workers=3)
+    vpcs_future = prefetch.submit(list_vpcs, session)
+    keys_future = prefetch.submit(list_ssh_keys, session)
+    subnets_future = (
+        prefetch.submit(list_subnets, session, prev_vpc) if prev_vpc else None
+    )
 
     # 1. Scenario Selection
     console.print()
@@ -1248,7 +1838,7 @@ def gather_inputs(session: boto3.Session):
                 value="update",
             ),
         ],
-        style=PROMPT_STYLE,
+        style=prompt_style,
     ).ask()
 
     if not scenario:
@@ -1259,33 +1849,41 @@ def gather_inputs(session: boto3.Session):
     if scenario == "update":
         cluster_id = questionary.text(
             "Existing Cluster ID (e.g., clusa1b2):",
-            style=PROMPT_STYLE,
+            style=prompt_style,
             validate=validate_cluster_id,
         ).ask()
         if cluster_id is None:
             sys.exit(0)
+        cluster_id = cluster_id.strip()
 
     # 2. Region (Confirm or Change)
     current_region = existing_vars.get("region") or session.region_name or "ap-south-1"
     region = questionary.text(
         "AWS Region:",
         default=current_region,
-        style=PROMPT_STYLE,
+        style=prompt_style,
         validate=validate_required,
     ).ask()
     if region is None:
         sys.exit(0)
-
-    # Re-init session if region changed
-    if region != session.region_name:
-        session = boto3.Session(region_name=region)
+    region = region.strip()
+
+    # Re-init session (same profile) only if the region actually changed; the
+    # prefetched lists are then for the old region, so resubmit them. Otherwise
+    # the in-flight lookups are reused as-is.
+    region_changed = region != session.region_name
+    if region_changed:
+        session = session_for_region(session, region)
+        vpcs_future = prefetch.submit(list_vpcs, session)
+        keys_future = prefetch.submit(list_ssh_keys, session)
+        if prev_vpc:
+            subnets_future = prefetch.submit(list_subnets, session, prev_vpc)
+    prefetch.shutdown(wait=False)
 
     # 3. Cluster Name, ID, & Tenant ID (Hoisted)
 
     # Generate cluster_id early if needed
     if scenario in ["new", "existing"]:
-        import uuid
-
         # Check if we have one already
         existing_cid = existing_vars.get("cluster_id")
 
@@ -1306,13 +1904,13 @@ def gather_inputs(session: boto3.Session):
                 existing_vars.pop("head_node_instance_id", None)
                 existing_cid = None
 
-            cluster_id = f"clus{uuid.uuid4().hex[:4]}"
+            cluster_id = f"clus{uuid4().hex[:4]}"
             console.print(f"[cyan]Generated FRESH cluster ID: {cluster_id}[/cyan]")
 
         elif existing_cid:
             cluster_id = existing_cid
         else:
-            cluster_id = f"clus{uuid.uuid4().hex[:4]}"
+            cluster_id = f"clus{uuid4().hex[:4]}"
             console.print(f"[cyan]Generated cluster ID: {cluster_id}[/cyan]")
     else:
         # Update scenario handled above
@@ -1327,7 +1925,7 @@ def gather_inputs(session: boto3.Session):
     cluster_name = questionary.text(
         "Cluster Name:",
         default=default_base,
-        style=PROMPT_STYLE,
+        style=prompt_style,
         validate=validate_required,
     ).ask()
     if cluster_name is None:
@@ -1350,18 +1948,20 @@ def gather_inputs(session: boto3.Session):
             head_node_id = questionary.text(
                 "Head Node Instance ID (i-...):",
                 default=default_head,
-                style=PROMPT_STYLE,
+                style=prompt_style,
                 validate=validate_required,
             ).ask()
             if not head_node_id:
                 sys.exit(0)  # User cancelled
 
             # Verify Head Node and get VPC/Subnet
-            ec2 = session.client("ec2")
+            console.print(f"[dim]Verifying instance {head_node_id}...[/dim]")
             try:
-                console.print(f"[dim]Verifying instance {head_node_id}...[/dim]")
-                resp = ec2.describe_instances(InstanceIds=[head_node_id])
-                inst = resp["Reservations"][0]["Instances"][0]
+                inst = describe_instance(head_node_id, session)
+            except ClientError:
+                inst = None
+
+            if inst is not None:
                 vpc_id = inst["VpcId"]
                 subnet_id = inst["SubnetId"]
 
@@ -1376,29 +1976,27 @@ def gather_inputs(session: boto3.Session):
                     f"[green]✓ Found instance in {vpc_id} / {subnet_id}[/green]"
                 )
                 break  # Valid!
-            except Exception:
-                console.print(
-                    f"[red]❌ Could not find instance {head_node_id} in {region}[/red]"
-                )
-                if not questionary.confirm("Try again?", default=True).ask():
-                    sys.exit(1)
-                default_head = ""  # Clear default on retry
+
+            console.print(
+                f"[red]❌ Could not find instance {head_node_id} in {region}[/red]"
+            )
+            if not questionary.confirm("Try again?", default=True).ask():
+                sys.exit(1)
+            default_head = ""  # Clear default on retry
 
     else:  # NEW Cluster
         # VPC Selection
-        vpcs = list_vpcs(session)
-        vpc_choices = [
-            questionary.Choice(f"{v['id']} ({v['name']})", value=v["id"]) for v in vpcs
-        ]
+        vpcs = vpcs_future.result()
+        vpc_choices = as_choices(vpcs, vpc_label)
         if vpc_choices:
             default_vpc = existing_vars.get("vpc_id")
-            if default_vpc and not any(c.value == default_vpc for c in vpc_choices):
+            if default_vpc not in {v["id"] for v in vpcs}:
                 default_vpc = None
             vpc_id = questionary.select(
                 "Select VPC:",
                 choices=vpc_choices,
                 default=default_vpc,
-                style=PROMPT_STYLE,
+                style=prompt_style,
             ).ask()
             if vpc_id is None:
                 sys.exit(0)
@@ -1406,26 +2004,25 @@ def gather_inputs(session: boto3.Session):
             vpc_id = questionary.text(
                 "VPC ID:",
                 default=existing_vars.get("vpc_id", ""),
-                style=PROMPT_STYLE,
+                style=prompt_style,
                 validate=validate_required,
             ).ask()
             if vpc_id is None:
                 sys.exit(0)
 
         # Subnet Selection using Boto3 (Validation!)
-        subnets = list_subnets(session, vpc_id)
+        if subnets_future and vpc_id == prev_vpc:
+            subnets = subnets_future.result()
+        else:
+            subnets = list_subnets(session, vpc_id)
         if not subnets:
             console.print(f"[red]❌ No subnets found in {vpc_id}[/red]")
             sys.exit(1)
+        subnet_by_id = {s["id"]: s for s in subnets}
 
-        subnet_choices = [
-            questionary.Choice(f"{s['id']} ({s['name']} - {s['az']})", value=s["id"])
-            for s in subnets
-        ]
+        subnet_choices = as_choices(subnets, subnet_label)
         default_subnet = existing_vars.get("subnet_id")
-        if default_subnet and not any(
-            c.value == default_subnet for c in subnet_choices
-        ):
+        if default_subnet and default_subnet not in subnet_by_id:
             console.print(
                 f"[yellow]⚠ Previous subnet {default_subnet} not found. Please select properly.[/yellow]"
             )
@@ -1435,13 +2032,13 @@ def gather_inputs(session: boto3.Session):
             "Select Subnet (Public for Head Node):",
             choices=subnet_choices,
             default=default_subnet,
-            style=PROMPT_STYLE,
+            style=prompt_style,
         ).ask()
         if subnet_id is None:
             sys.exit(0)
 
         # Secondary Subnet Selection (for Aurora - Different AZ)
-        selected_az = next((s["az"] for s in subnets if s["id"] == subnet_id), None)
+        selected_az = subnet_by_id[subnet_id]["az"]
         secondary_subnets = [s for s in subnets if s["az"] != selected_az]
 
         if not secondary_subnets:
@@ -1450,13 +2047,11 @@ def gather_inputs(session: boto3.Session):
             )
             sys.exit(1)
 
-        secondary_choices = [
-            questionary.Choice(f"{s['id']} ({s['name']} - {s['az']})", value=s["id"])
-            for s in secondary_subnets
-        ]
+        secondary_choices = as_choices(secondary_subnets, subnet_label)
         default_secondary = existing_vars.get("secondary_subnet_id")
-        if default_secondary and not any(
-            c.value == default_secondary for c in secondary_choices
+        if (
+            default_secondary not in subnet_by_id
+            or subnet_by_id[default_secondary]["az"] == selected_az
         ):
             default_secondary = None
 
@@ -1464,7 +2059,7 @@ def gather_inputs(session: boto3.Session):
             "Select Secondary Subnet (Different AZ for Aurora):",
             choices=secondary_choices,
             default=default_secondary,
-            style=PROMPT_STYLE,
+            style=prompt_style,
         ).ask()
         if secondary_subnet_id is None:
             sys.exit(0)
@@ -1475,48 +2070,52 @@ def gather_inputs(session: boto3.Session):
     tenant_id = questionary.text(
         "Tenant ID (ten_...):",
         default=existing_vars.get("tenant_id", ""),
-        style=PROMPT_STYLE,
+        style=prompt_style,
         validate=validate_required,
     ).ask()
     if tenant_id is None:
         sys.exit(0)
 
-    # Ensure generated dir exists
-    Path("generated").mkdir(exist_ok=True)
-
-    # Write to tfvars
-    with open("generated/terraform.tfvars", "w") as f:
-        f.write(f'region = "{region}"\n')
-        f.write(f'cluster_name = "{cluster_name}"\n')
-        f.write(f'vpc_id = "{vpc_id}"\n')
-        f.write(f'subnet_id = "{subnet_id}"\n')
-        f.write(f'secondary_subnet_id = "{secondary_subnet_id}"\n')
-        f.write(f'tenant_id = "{tenant_id}"\n')
-        f.write(f'cluster_id = "{cluster_id}"\n')
-        # Inject Dev/Prod specific variables
-        f.write(
-            f'clusterra_api_endpoint = "{DEFAULT_API_URL.replace("https://", "")}"\n'
+    # Ask for SSH Key for new clusters
+    ssh_key = ""
+    if scenario == "new":
+        ssh_keys = keys_future.result()
+        ssh_key = (
+            questionary.select("SSH Key:", choices=ssh_keys, style=prompt_style).ask()
+            if ssh_keys
+            else questionary.text("SSH Key Name:", validate=validate_required).ask()
         )
-        f.write(f'clusterra_service_network_id = "{CLUSTERRA_SERVICE_NETWORK_ID}"\n')
-        f.write(f'clusterra_account_id = "{CLUSTERRA_SERVICE_ACCOUNT_ID}"\n')
+        if ssh_key is None:
+            sys.exit(0)
 
+    tfvars = {
+        "region": region,
+        "cluster_name": cluster_name,
+        "vpc_id": vpc_id,
+        "subnet_id": subnet_id,
+        "secondary_subnet_id": secondary_subnet_id,
+        "tenant_id": tenant_id,
+        "cluster_id": cluster_id,
+        # Inject Dev/Prod specific variables
+        "clusterra_api_endpoint": DEFAULT_API_URL.replace("https://", ""),
+        "clusterra_service_network_id": CLUSTERRA_SERVICE_NETWORK_ID,
+        "clusterra_account_id": CLUSTERRA_SERVICE_ACCOUNT_ID,
         # New vs Existing/Update Logic
-        if scenario == "new":
-            f.write("deploy_new_cluster = true\n")
-            # Ask for SSH Key for new clusters
-            keys = list_ssh_keys(session)
-            key = (
-                questionary.select("SSH Key:", choices=keys, style=PROMPT_STYLE).ask()
-                if keys
-                else questionary.text("SSH Key Name:", validate=validate_required).ask()
-            )
-            if key is None:
-                sys.exit(0)
-            f.write(f'ssh_key_name = "{key}"\n')
-        else:
-            f.write("deploy_new_cluster = false\n")
-            if head_node_id:
-                f.write(f'head_node_instance_id = "{head_node_id}"\n')
+        "deploy_new_cluster": "true" if scenario == "new" else "false",
+    }
+    if ssh_key:
+        tfvars["ssh_key_name"] = ssh_key
+    if head_node_id:
+        tfvars["head_node_instance_id"] = head_node_id
+
+    rendered = TFVARS_TEMPLATE.format_map(tfvars)
+    if ssh_key:
+        rendered += f'ssh_key_name = "{ssh_key}"\n'
+    if head_node_id:
+        rendered += f'head_node_instance_id = "{head_node_id}"\n'
+    write_text_atomic(TFVARS_PATH, rendered)
+
+    return tfvars
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -1525,11 +2124,7 @@ def gather_inputs(session: boto3.Session):
 
 
 def main():
-    parser = argparse.ArgumentParser(description="Clusterra Connect Installer")
-    parser.add_argument("--dry-run", action="store_true")
-    parser.add_argument("--profile")
-    parser.add_argument("--region")
-    args = parser.parse_args()
+    args = ARGS or parse_args()
 
     if args.profile:
         os.environ["AWS_PROFILE"] = args.profile
@@ -1546,25 +2141,16 @@ def main():
             sys.exit(1)
 
         session = get_aws_session(args.profile, args.region)
-        gather_inputs(session)  # Ensure tfvars exist
-
-        # Load vars for params
-        # Simple regex parser to avoid hcl dependency
-        import re
-
-        tfvars = {}
-        if Path("generated/terraform.tfvars").exists():
-            content = Path("generated/terraform.tfvars").read_text()
-            for line in content.splitlines():
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                match = re.search(r'(\w+)\s*=\s*"?([^"]*)"?', line)
-                if match:
-                    tfvars[match.group(1)] = match.group(2)
+        if args.refresh:
+            shutil.rmtree(AWS_CACHE_DIR, ignore_errors=True)
+        # Writes generated/terraform.tfvars and hands back the same values
+        tfvars = gather_inputs(session)
 
         cluster_name = tfvars.get("cluster_name", "")
         region = tfvars.get("region", "")
+        # The phases must talk to the region the user picked, not the default
+        if region and region != session.region_name:
+            session = session_for_region(session, region)
         tenant_id = tfvars.get("tenant_id", "")
         deploy_new = tfvars.get("deploy_new_cluster", "true").lower() == "true"
 
@@ -126,6 +126,14 @@ resource "aws_iam_role_policy" "head_node_clusterra_access" {
           "iot:Publish"
         ]
         Resource = "arn:aws:iot:${var.clusterra_region}:${local.clusterra_account_id}:topic/clusterra/*"
+      },
+      {
+        Sid    = "ReadScratchPackages"
+        Effect = "Allow"
+        Action = [
+          "s3:GetObject"
+        ]
+        Resource = "${aws_s3_bucket.scratch.arn}/*"
       }
     ]
   })
@@ -231,6 +239,59 @@ resource "aws_ssm_association" "configure_head_node" {
   ]
 }
 
+# ─────────────────────────────────────────────────────────────────────────────
+# SCRATCH BUCKET (Script packages staged by install.py)
+# ─────────────────────────────────────────────────────────────────────────────
+
+# install.py uploads hook bundles here instead of inlining them as base64 in
+# SSM command parameters (which are size-limited). Objects are deleted after use.
+resource "aws_s3_bucket" "scratch" {
+  # checkov:skip=CKV_AWS_18:Access logging not needed for transient install packages
+  # checkov:skip=CKV_AWS_21:Versioning not needed for transient install packages
+  # checkov:skip=CKV_AWS_144:Cross-region replication not needed
+  # checkov:skip=CKV_AWS_145:Default SSE-S3 encryption is sufficient
+  # checkov:skip=CKV2_AWS_62:Event notifications not needed
+  bucket        = "clusterra-scratch-${var.cluster_id}-${data.aws_caller_identity.current.account_id}"
+  force_destroy = true
+
+  tags = {
+    Name      = "clusterra-scratch-${var.cluster_id}"
+    ManagedBy = "OpenTOFU"
+    ClusterId = var.cluster_id
+  }
+}
+
+resource "aws_s3_bucket_public_access_block" "scratch" {
+  bucket = aws_s3_bucket.scratch.id
+
+  block_public_acls       = true
+  block_public_policy     = true
+  ignore_public_acls      = true
+  restrict_public_buckets = true
+}
+
+resource "aws_s3_bucket_lifecycle_configuration" "scratch" {
+  bucket = aws_s3_bucket.scratch.id
+
+  # Safety net for packages left behind by an interrupted install
+  rule {
+    id     = "expire-packages"
+    status = "Enabled"
+
+    filter {
+      prefix = "packages/"
+    }
+
+    expiration {
+      days = 1
+    }
+
+    abort_incomplete_multipart_upload {
+      days_after_initiation = 1
+    }
+  }
+}
+
 # ─────────────────────────────────────────────────────────────────────────────
 # VPC LATTICE SERVICE NETWORK (Shared from Clusterra Control Plane)
 # ─────────────────────────────────────────────────────────────────────────────
@@ -662,6 +723,7 @@ output "clusterra_onboarding" {
     role_arn                   = aws_iam_role.clusterra_access.arn
     external_id                = "clusterra-${var.cluster_id}"
     head_node_instance_id      = local.target_instance_id
+    scratch_bucket             = aws_s3_bucket.scratch.id
   }
 }
 
@@ -7,17 +7,19 @@ Removes resources provisioned by install.py:
 """
 
 import argparse
+import functools
 import os
+import re
 import shutil
 import subprocess
 import sys
-import time
+import threading
 from pathlib import Path
 
 # Dependency Check
 try:
     import boto3
-    from botocore.exceptions import ClientError, ProfileNotFound
+    from botocore.exceptions import ClientError, ProfileNotFound, WaiterError
 except ImportError:
     print("❌ boto3 is required. Install with: pip install boto3")
     sys.exit(1)
@@ -69,6 +71,12 @@ def get_aws_session(
         sys.exit(1)
 
 
+@functools.cache
+def get_client(session: boto3.Session, service: str):
+    """Return a boto3 client for a service, built once per session."""
+    return session.client(service)
+
+
 def load_tfvars() -> dict:
     """Load current cluster config from tfvars."""
     path = Path("generated/terraform.tfvars")
@@ -76,8 +84,6 @@ def load_tfvars() -> dict:
         return {}
 
     config = {}
-    import re
-
     content = path.read_text()
     for line in content.splitlines():
         line = line.strip()
@@ -90,7 +96,7 @@ def load_tfvars() -> dict:
 
 
 def get_pcluster_status(cluster_name: str, session: boto3.Session) -> str:
-    cfn = session.client("cloudformation")
+    cfn = get_client(session, "cloudformation")
     try:
         response = cfn.describe_stacks(StackName=cluster_name)
         if response["Stacks"]:
@@ -150,21 +156,38 @@ def delete_pcluster(
         SpinnerColumn(), TextColumn("{task.description}"), console=console
     ) as progress:
         task = progress.add_task("Deleting Cluster...", total=None)
-        while True:
-            time.sleep(10)
-            status = get_pcluster_status(cluster_name, session)
-
-            if status == "NOT_FOUND" or "DELETE_COMPLETE" in status:
-                progress.update(task, description="[green]✓ Cluster deleted[/green]")
-                return True
-
-            if "DELETE_FAILED" in status:
-                progress.update(
-                    task, description=f"[red]❌ Deletion failed: {status}[/red]"
+        cfn = get_client(session, "cloudformation")
+        succeeded = []
+
+        # The waiter decides completion (a vanished stack counts as deleted,
+        # DELETE_FAILED ends it early). Daemon thread so Ctrl-C isn't held up.
+        def wait_for_delete():
+            try:
+                cfn.get_waiter("stack_delete_complete").wait(
+                    StackName=cluster_name,
+                    WaiterConfig={"Delay": 15, "MaxAttempts": 240},
                 )
-                return False
+                succeeded.append(True)
+            except (WaiterError, ClientError):
+                pass
 
+        waiter_thread = threading.Thread(target=wait_for_delete, daemon=True)
+        waiter_thread.start()
+
+        # Refresh the displayed status every 30s while the waiter runs
+        waiter_thread.join(timeout=30)
+        while waiter_thread.is_alive():
+            status = get_pcluster_status(cluster_name, session)
             progress.update(task, description=f"Status: {status}")
+            waiter_thread.join(timeout=30)
+
+        if succeeded:
+            progress.update(task, description="[green]✓ Cluster deleted[/green]")
+            return True
+
+        status = get_pcluster_status(cluster_name, session)
+        progress.update(task, description=f"[red]❌ Deletion failed: {status}[/red]")
+        return False
 
 
 def destroy_tofu_resources(dry_run: bool):